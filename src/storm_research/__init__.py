@@ -1,5 +1,46 @@
 """STORM Research Assistant System Package"""
 
-from storm_research.graph import graph
+import importlib
+import os
+from typing import Any
 
-__all__ = ["graph"]
\ No newline at end of file
+from storm_research.utils import (
+    install_eager_task_factory,
+    install_llm_cache,
+    install_uvloop,
+)
+from storm_research.tools import install_arxiv_cache, preload_default_tools
+
+# Opt in to the uvloop event loop and eager tasks before any graph is run
+if os.environ.get("STORM_UVLOOP") == "1":
+    install_uvloop()
+if os.environ.get("STORM_EAGER_TASKS") == "1":
+    install_eager_task_factory()
+
+# Opt in to caching LLM responses across runs
+if os.environ.get("STORM_LLM_CACHE") == "1":
+    install_llm_cache()
+
+_graph_module = importlib.import_module("storm_research.graph")
+
+# Opt in to caching ArXiv results on disk across runs
+if os.environ.get("STORM_ARXIV_CACHE") == "1":
+    install_arxiv_cache()
+
+# Opt in to building the default search tools at import time
+if os.environ.get("STORM_PRELOAD_TOOLS") == "1":
+    preload_default_tools()
+
+# Importing the submodule binds it as the package attribute "graph";
+# drop that binding so the compiled graph is resolved through __getattr__
+globals().pop("graph", None)
+
+
+def __getattr__(name: str) -> Any:
+    """Return the compiled research graph, building it on first access"""
+    if name == "graph":
+        return _graph_module.graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["graph"]
@@ -3,12 +3,13 @@
 This module manages runtime configuration for the research assistant system.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Optional
 from langchain_core.runnables import RunnableConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Configuration:
     """STORM Research Assistant Configuration Class
 
@@ -65,6 +66,22 @@ class Configuration:
         },
     )
 
+    max_search_concurrency: int = field(
+        default=8,
+        metadata={
+            "description": "Maximum number of concurrent search API calls",
+            "range": [1, 32],
+        },
+    )
+
+    search_cache_size: int = field(
+        default=256,
+        metadata={
+            "description": "Number of search results cached per source (0 disables)",
+            "range": [0, 4096],
+        },
+    )
+
     # Parallel Processing Settings
     parallel_interviews: bool = field(
         default=True, metadata={"description": "Whether to run interviews in parallel"}
@@ -87,25 +104,37 @@ class Configuration:
         Returns:
             Configuration instance with applied settings
         """
-        configurable = config.get("configurable", {}) if config else {}
-
-        # Create default instance to get default values
-        defaults = cls()
-
-        return cls(
-            model=configurable.get("model", defaults.model),
-            max_analysts=configurable.get("max_analysts", defaults.max_analysts),
-            max_interview_turns=configurable.get(
-                "max_interview_turns", defaults.max_interview_turns
-            ),
-            tavily_max_results=configurable.get(
-                "tavily_max_results", defaults.tavily_max_results
-            ),
-            arxiv_max_docs=configurable.get("arxiv_max_docs", defaults.arxiv_max_docs),
-            parallel_interviews=configurable.get(
-                "parallel_interviews", defaults.parallel_interviews
-            ),
-            enable_checkpointing=configurable.get(
-                "enable_checkpointing", defaults.enable_checkpointing
-            ),
+        configurable = (config or {}).get("configurable") or {}
+
+        # Fast path: nothing configured, reuse the shared default instance
+        if not configurable:
+            return _DEFAULTS
+
+        # Only configuration fields take part in the cache key, so per-run
+        # values such as thread_id do not defeat the cache
+        items = tuple(
+            (name, configurable[name])
+            for name in _FIELD_NAMES
+            if name in configurable
         )
+        try:
+            return _build_configuration(cls, items)
+        except TypeError:
+            # Unhashable override values cannot be cached
+            return cls(**dict(items))
+
+
+# Field names read once from the dataclass fields
+_FIELD_NAMES = tuple(f.name for f in fields(Configuration))
+
+
+@lru_cache(maxsize=128)
+def _build_configuration(
+    cls: type[Configuration], items: tuple[tuple[str, object], ...]
+) -> Configuration:
+    """Build and cache a Configuration for a set of overridden fields"""
+    return cls(**dict(items))
+
+
+# Shared immutable default configuration
+_DEFAULTS = Configuration()
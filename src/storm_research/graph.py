@@ -3,11 +3,11 @@
 This module defines the LangGraph graph that orchestrates the research process.
 """
 
-from typing import List, Literal, cast
+from typing import Any, List, Literal, cast
 from langchain_core.messages import (
+    AIMessage,
     HumanMessage,
     SystemMessage,
-    AIMessage,
     get_buffer_string,
 )
 from langchain_core.runnables import RunnableConfig
@@ -23,20 +23,26 @@ from storm_research.state import (
     ResearchGraphState,
     Analyst,
     Perspectives,
+    ReportParts,
     SearchQuery,
 )
 from storm_research.prompts import (
-    ANALYST_INSTRUCTIONS,
-    QUESTION_INSTRUCTIONS,
-    ANSWER_INSTRUCTIONS,
-    SEARCH_INSTRUCTIONS,
-    SECTION_WRITER_INSTRUCTIONS,
-    REPORT_WRITER_INSTRUCTIONS,
-    INTRO_CONCLUSION_INSTRUCTIONS,
+    SEARCH_SYSTEM_MESSAGE,
+    question_system_message,
+    render_analyst_instructions,
+    render_first_question,
+    render_answer_instructions,
+    render_section_writer_instructions,
+    render_report_parts_instructions,
 )
 from storm_research.configuration import Configuration
 from storm_research.tools import get_search_tools
-from storm_research.utils import load_chat_model, generate_thread_id
+from storm_research.utils import (
+    load_chat_model,
+    load_structured_model,
+    llm_semaphore,
+    generate_thread_id,
+)
 
 
 # ====================== Analyst Generation Node ======================
@@ -48,30 +54,32 @@ async def create_analysts(state: ResearchGraphState, config: RunnableConfig) ->
     Each analyst contributes to the research with unique perspectives and expertise.
     """
     configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
 
     topic = state["messages"][-1].content
     max_analysts = state.get("max_analysts", configuration.max_analysts)
 
     # Configure model for structured output
-    structured_model = model.with_structured_output(Perspectives)
+    structured_model = load_structured_model(configuration.model, Perspectives)
 
     # Construct prompt
-    system_message = ANALYST_INSTRUCTIONS.format(
+    system_message = render_analyst_instructions(
         topic=topic,
         human_analyst_feedback="",  # User feedback is empty
         max_analysts=max_analysts,
     )
 
     # Generate analysts
-    result = await structured_model.ainvoke(
-        [
-            SystemMessage(content=system_message),
-            HumanMessage(content="Generate the set of analysts."),
-        ]
-    )
+    async with llm_semaphore():
+        result = await structured_model.ainvoke(
+            [
+                SystemMessage(content=system_message),
+                HumanMessage(content="Generate the set of analysts."),
+            ]
+        )
 
-    return {"analysts": result.analysts}
+    # Start from no sections so a re-run on the same thread does not keep
+    # sections written for an earlier topic
+    return {"topic": topic, "analysts": result.analysts, "sections": None}
 
 
 # ====================== Interview Nodes ======================
@@ -90,56 +98,46 @@ async def generate_question(state: InterviewState, config: RunnableConfig) -> di
     messages = state["messages"]
 
     # Construct question generation prompt
-    system_message = QUESTION_INSTRUCTIONS.format(goals=analyst.persona)
+    system_message = question_system_message(analyst.persona)
 
     # Generate question
-    question = await model.ainvoke([SystemMessage(content=system_message)] + messages)
+    async with llm_semaphore():
+        question = await model.ainvoke([system_message] + messages)
 
-    return {"messages": [question]}
+    return {"messages": [question], "interview_buffer": get_buffer_string([question])}
 
 
-async def search_web(state: InterviewState, config: RunnableConfig) -> dict:
-    """Search for relevant information on the web
+async def generate_search_query(state: InterviewState, config: RunnableConfig) -> dict:
+    """Generate a search query from the conversation
 
-    Analyzes conversation content to generate appropriate search queries
-    and searches for relevant information on the web.
+    Analyzes conversation content once to generate a query
+    shared by the web and ArXiv searches.
     """
     configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
-    search_tools = get_search_tools(config)
 
     # Generate search query
-    structured_model = model.with_structured_output(SearchQuery)
-    search_query = await structured_model.ainvoke(
-        [SystemMessage(content=SEARCH_INSTRUCTIONS)] + state["messages"]
-    )
-
-    # Perform web search
-    search_results = await search_tools.search_web(search_query.search_query)
+    structured_model = load_structured_model(configuration.model, SearchQuery)
+    async with llm_semaphore():
+        search_query = await structured_model.ainvoke(
+            [SEARCH_SYSTEM_MESSAGE] + state["messages"]
+        )
 
-    return {"context": [search_results]}
+    return {"search_query": search_query.search_query}
 
 
-async def search_arxiv(state: InterviewState, config: RunnableConfig) -> dict:
-    """Search for academic papers on ArXiv
+async def search_all(state: InterviewState, config: RunnableConfig) -> dict:
+    """Search the web and ArXiv for relevant information
 
-    Analyzes conversation content to generate appropriate search queries
-    and searches for relevant papers on ArXiv.
+    Runs web and ArXiv searches concurrently with the query
+    generated from the conversation.
     """
-    configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
     search_tools = get_search_tools(config)
+    search_query = state["search_query"]
 
-    # Generate search query
-    structured_model = model.with_structured_output(SearchQuery)
-    search_query = await structured_model.ainvoke(
-        [SystemMessage(content=SEARCH_INSTRUCTIONS)] + state["messages"]
-    )
+    # Perform web and ArXiv searches concurrently
+    search_results = await search_tools.search_all(search_query)
 
-    # Perform ArXiv search
-    search_results = await search_tools.search_arxiv(search_query.search_query)
-
-    return {"context": [search_results]}
+    return {"context": [search_results["web"], search_results["arxiv"]]}
 
 
 async def generate_answer(state: InterviewState, config: RunnableConfig) -> dict:
@@ -156,31 +154,40 @@ async def generate_answer(state: InterviewState, config: RunnableConfig) -> dict
     context = state["context"]
 
     # Construct answer generation prompt
-    system_message = ANSWER_INSTRUCTIONS.format(goals=analyst.persona, context=context)
+    system_message = render_answer_instructions(goals=analyst.persona, context=context)
 
     # Generate answer
-    answer = await model.ainvoke([SystemMessage(content=system_message)] + messages)
+    async with llm_semaphore():
+        answer = await model.ainvoke(
+            [SystemMessage(content=system_message)] + messages
+        )
 
     # Mark as expert answer
     answer.name = "expert"
 
-    return {"messages": [answer]}
+    return {
+        "messages": [answer],
+        "interview_buffer": get_buffer_string([answer]),
+        "num_expert_responses": 1,
+    }
 
 
 async def save_interview(state: InterviewState) -> dict:
     """Save completed interview content
 
-    Converts conversation content to string format and saves it.
+    The transcript is accumulated turn by turn in interview_buffer,
+    so no conversion of the full message history is needed here.
     """
-    messages = state["messages"]
-    interview_content = get_buffer_string(messages)
+    return {"interview": state["interview_buffer"]}
+
 
-    return {"interview": interview_content}
+# Phrase the analyst uses to close the interview (see QUESTION_INSTRUCTIONS),
+# looked for only near the end of the question
+_END_SIGNAL = "Thank you so much for your help"
+_END_SIGNAL_WINDOW = 200
 
 
-def route_messages(
-    state: InterviewState, name: str = "expert"
-) -> Literal["ask_question", "save_interview"]:
+def route_messages(state: InterviewState) -> Literal["ask_question", "save_interview"]:
     """Determine next step based on interview progress
 
     Saves when maximum turns are reached or interview is complete,
@@ -189,18 +196,15 @@ def route_messages(
     messages = state["messages"]
     max_num_turns = state.get("max_num_turns", 3)
 
-    # Check number of expert responses
-    num_responses = len(
-        [m for m in messages if isinstance(m, AIMessage) and m.name == name]
-    )
-
     # Check if maximum turns reached
-    if num_responses >= max_num_turns:
+    if state.get("num_expert_responses", 0) >= max_num_turns:
         return "save_interview"
 
-    # Check for interview end signal
-    last_question = messages[-2]
-    if "Thank you so much for your help" in last_question.content:
+    # Check for interview end signal, which the analyst puts at the end;
+    # .text is a str even when the content is a list of blocks
+    last_question = messages[-2].text
+    tail_start = max(0, len(last_question) - _END_SIGNAL_WINDOW)
+    if last_question.find(_END_SIGNAL, tail_start) != -1:
         return "save_interview"
 
     return "ask_question"
@@ -210,7 +214,8 @@ async def write_section(state: InterviewState, config: RunnableConfig) -> dict:
     """Write report section based on interview content
 
     Organizes interview content from the analyst's perspective
-    to write a section of the report.
+    to write a section of the report. Only the section is handed to the
+    main graph; the collected sources stay in the interview subgraph.
     """
     configuration = Configuration.from_runnable_config(config)
     model = load_chat_model(configuration.model)
@@ -219,17 +224,18 @@ async def write_section(state: InterviewState, config: RunnableConfig) -> dict:
     analyst = state["analyst"]
 
     # Construct section writing prompt
-    system_message = SECTION_WRITER_INSTRUCTIONS.format(focus=analyst.description)
+    system_message = render_section_writer_instructions(focus=analyst.description)
 
     # Write section
-    section = await model.ainvoke(
-        [
-            SystemMessage(content=system_message),
-            HumanMessage(content=f"Use this source to write your section: {context}"),
-        ]
-    )
+    async with llm_semaphore():
+        section = await model.ainvoke(
+            [
+                SystemMessage(content=system_message),
+                HumanMessage(content=f"Use this source to write your section: {context}"),
+            ]
+        )
 
-    return {"sections": [section.content]}
+    return {"sections": {state["analyst_index"]: section.content}}
 
 
 # ====================== Report Writing Nodes ======================
@@ -239,112 +245,78 @@ def initiate_all_interviews(state: ResearchGraphState) -> List[Send]:
     """Start interviews for all analysts simultaneously
 
     Initiates independent interview processes for each analyst.
+    Each interview opens with a templated first question from the analyst,
+    so it starts directly with the search step.
     """
     topic = state.get("topic", "")
+    opening_question = f"So you said you were writing an article on {topic}?"
+    opening_buffer = get_buffer_string([HumanMessage(content=opening_question)])
 
     # Start interview for each analyst
-    return [
-        Send(
-            "conduct_interview",
-            {
-                "analyst": analyst,
-                "messages": [
-                    HumanMessage(
-                        content=f"So you said you were writing an article on {topic}?"
-                    )
-                ],
-                "max_num_turns": state.get("max_num_turns", 3),
-            },
+    sends = []
+    for analyst_index, analyst in enumerate(state["analysts"]):
+        first_question = AIMessage(
+            content=render_first_question(
+                topic=topic,
+                name=analyst.name,
+                role=analyst.role,
+                affiliation=analyst.affiliation,
+                description=analyst.description,
+            )
+        )
+        messages = [HumanMessage(content=opening_question), first_question]
+        sends.append(
+            Send(
+                "conduct_interview",
+                {
+                    "analyst": analyst,
+                    "analyst_index": analyst_index,
+                    "messages": messages,
+                    "interview_buffer": opening_buffer
+                    + "\n"
+                    + get_buffer_string([first_question]),
+                    "max_num_turns": state.get("max_num_turns", 3),
+                },
+            )
         )
-        for analyst in state["analysts"]
-    ]
-
-
-async def write_report(state: ResearchGraphState, config: RunnableConfig) -> dict:
-    """Write report body by integrating all sections
-
-    Synthesizes sections written by each analyst
-    into a coherent integrated report.
-    """
-    configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
-
-    sections = state["sections"]
-    topic = state.get("topic", "")
-
-    # Connect all sections
-    formatted_sections = "\n\n".join(sections)
-
-    # Construct report writing prompt
-    system_message = REPORT_WRITER_INSTRUCTIONS.format(
-        topic=topic, context=formatted_sections
-    )
-
-    # Write report
-    report = await model.ainvoke(
-        [
-            SystemMessage(content=system_message),
-            HumanMessage(content="Write a report based upon these memos."),
-        ]
-    )
 
-    return {"content": report.content}
+    return sends
 
 
-async def write_introduction(state: ResearchGraphState, config: RunnableConfig) -> dict:
-    """Write report introduction
+async def write_report_parts(state: ResearchGraphState, config: RunnableConfig) -> dict:
+    """Write report introduction, body, and conclusion
 
-    Creates an engaging introduction that summarizes
-    the entire research and captures reader interest.
+    Synthesizes sections written by each analyst into the report body
+    together with its introduction and conclusion in a single model call.
     """
     configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
 
-    sections = state["sections"]
     topic = state.get("topic", "")
 
-    # Connect all sections
-    formatted_sections = "\n\n".join(sections)
-
-    # Construct introduction writing prompt
-    instructions = INTRO_CONCLUSION_INSTRUCTIONS.format(
-        topic=topic, formatted_str_sections=formatted_sections
-    )
-
-    # Write introduction
-    intro = await model.ainvoke(
-        [instructions, HumanMessage(content="Write the report introduction")]
-    )
-
-    return {"introduction": intro.content}
-
-
-async def write_conclusion(state: ResearchGraphState, config: RunnableConfig) -> dict:
-    """Write report conclusion
-
-    Creates a conclusion that summarizes key findings
-    and suggests future research directions.
-    """
-    configuration = Configuration.from_runnable_config(config)
-    model = load_chat_model(configuration.model)
-
+    # Join the sections in analyst order
     sections = state["sections"]
-    topic = state.get("topic", "")
+    formatted_sections = "\n\n".join(sections[index] for index in sorted(sections))
 
-    # Connect all sections
-    formatted_sections = "\n\n".join(sections)
-
-    # Construct conclusion writing prompt
-    instructions = INTRO_CONCLUSION_INSTRUCTIONS.format(
-        topic=topic, formatted_str_sections=formatted_sections
+    # Construct report writing prompt
+    system_message = render_report_parts_instructions(
+        topic=topic, context=formatted_sections
     )
 
-    # Write conclusion
-    conclusion = await model.ainvoke(
-        [instructions, HumanMessage(content="Write the report conclusion")]
-    )
+    # Write all report parts
+    structured_model = load_structured_model(configuration.model, ReportParts)
+    async with llm_semaphore():
+        report = await structured_model.ainvoke(
+            [
+                SystemMessage(content=system_message),
+                HumanMessage(content="Write a report based upon these memos."),
+            ]
+        )
 
-    return {"conclusion": conclusion.content}
+    return {
+        "introduction": report.introduction,
+        "content": report.body,
+        "conclusion": report.conclusion,
+    }
 
 
 async def finalize_report(state: ResearchGraphState) -> dict:
@@ -356,29 +328,28 @@ async def finalize_report(state: ResearchGraphState) -> dict:
     content = state["content"]
 
     # Remove "## Insights" title
-    if content.startswith("## Insights"):
-        content = content.strip("## Insights")
+    content = content.removeprefix("## Insights").lstrip()
 
     # Separate Sources section
     sources = None
-    if "## Sources" in content:
-        try:
-            content, sources = content.split("\n## Sources\n")
-        except:
-            sources = None
+    body, separator, sources_section = content.partition("\n## Sources\n")
+    if separator:
+        content, sources = body, sources_section
 
     # Assemble final report
-    final_report = (
-        state["introduction"]
-        + "\n\n---\n\n## Main Idea\n\n"
-        + content
-        + "\n\n---\n\n"
-        + state["conclusion"]
-    )
+    parts = [
+        state["introduction"],
+        "\n\n---\n\n## Main Idea\n\n",
+        content,
+        "\n\n---\n\n",
+        state["conclusion"],
+    ]
 
     # Add Sources section
     if sources is not None:
-        final_report += "\n\n## Sources\n" + sources
+        parts += ["\n\n## Sources\n", sources]
+
+    final_report = "".join(parts)
 
     return {
         "final_report": final_report,
@@ -399,26 +370,28 @@ def build_interview_graph():
 
     # Add nodes
     builder.add_node("ask_question", generate_question)
-    builder.add_node("search_web", search_web)
-    builder.add_node("search_arxiv", search_arxiv)
+    builder.add_node("generate_search_query", generate_search_query)
+    builder.add_node("search_all", search_all)
     builder.add_node("answer_question", generate_answer)
     builder.add_node("save_interview", save_interview)
     builder.add_node("write_section", write_section)
 
-    # Define edges
-    builder.add_edge(START, "ask_question")
-    builder.add_edge("ask_question", "search_web")
-    builder.add_edge("ask_question", "search_arxiv")
-    builder.add_edge("search_web", "answer_question")
-    builder.add_edge("search_arxiv", "answer_question")
+    # Define edges; the first question is already in the initial messages
+    builder.add_edge(START, "generate_search_query")
+    builder.add_edge("ask_question", "generate_search_query")
+    builder.add_edge("generate_search_query", "search_all")
+    builder.add_edge("search_all", "answer_question")
     builder.add_conditional_edges(
         "answer_question", route_messages, ["ask_question", "save_interview"]
     )
     builder.add_edge("save_interview", "write_section")
     builder.add_edge("write_section", END)
 
-    # LangGraph API automatically manages checkpointer
-    interview_graph = builder.compile().with_config(run_name="Conduct Interview")
+    # Interview state is ephemeral, so skip checkpointing inside the subgraph;
+    # the main graph still checkpoints the written sections
+    interview_graph = builder.compile(checkpointer=False).with_config(
+        run_name="Conduct Interview"
+    )
 
     return interview_graph
 
@@ -438,9 +411,7 @@ def build_research_graph():
     # Add nodes
     builder.add_node("create_analysts", create_analysts)
     builder.add_node("conduct_interview", interview_graph)
-    builder.add_node("write_report", write_report)
-    builder.add_node("write_introduction", write_introduction)
-    builder.add_node("write_conclusion", write_conclusion)
+    builder.add_node("write_report_parts", write_report_parts)
     builder.add_node("finalize_report", finalize_report)
 
     # Define edges
@@ -450,14 +421,10 @@ def build_research_graph():
     )
 
     # Report writing phase
-    builder.add_edge("conduct_interview", "write_report")
-    builder.add_edge("conduct_interview", "write_introduction")
-    builder.add_edge("conduct_interview", "write_conclusion")
+    builder.add_edge("conduct_interview", "write_report_parts")
 
     # Generate final report
-    builder.add_edge(
-        ["write_conclusion", "write_report", "write_introduction"], "finalize_report"
-    )
+    builder.add_edge("write_report_parts", "finalize_report")
     builder.add_edge("finalize_report", END)
 
     # LangGraph API automatically manages checkpointer
@@ -468,5 +435,11 @@ def build_research_graph():
 
 # ====================== Main Graph Instance ======================
 
-# Graph instance for use in LangGraph Studio
-graph = build_research_graph()
+
+def __getattr__(name: str) -> Any:
+    """Compile the graph instance for LangGraph Studio on first access"""
+    if name == "graph":
+        graph = build_research_graph()
+        globals()["graph"] = graph
+        return graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
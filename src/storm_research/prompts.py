@@ -3,6 +3,31 @@
 This module defines the prompts used at each stage of the research process.
 """
 
+from functools import lru_cache
+from string import Formatter
+from typing import Optional
+
+from langchain_core.messages import SystemMessage
+
+
+def _split_template(template: str) -> tuple[tuple[str, Optional[str]], ...]:
+    """Split a template into (literal text, field name) pairs once at import"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
+def _render(parts: tuple[tuple[str, Optional[str]], ...], values: dict) -> str:
+    """Render a split template by joining its literal text and field values"""
+    return "".join(
+        [
+            literal if field_name is None else literal + str(values[field_name])
+            for literal, field_name in parts
+        ]
+    )
+
+
 # ====================== Analyst Generation Prompts ======================
 
 ANALYST_INSTRUCTIONS = """You are tasked with creating a set of AI analyst personas. 
@@ -22,6 +47,22 @@ Follow these instructions carefully:
 
 5. Assign one analyst to each theme."""
 
+_ANALYST_PARTS = _split_template(ANALYST_INSTRUCTIONS)
+
+
+def render_analyst_instructions(
+    topic: str, human_analyst_feedback: str, max_analysts: int
+) -> str:
+    """Render ANALYST_INSTRUCTIONS"""
+    return _render(
+        _ANALYST_PARTS,
+        {
+            "topic": topic,
+            "human_analyst_feedback": human_analyst_feedback,
+            "max_analysts": max_analysts,
+        },
+    )
+
 
 # ====================== Interview Prompts ======================
 
@@ -44,6 +85,48 @@ When you are satisfied with your understanding, complete the interview with: "Th
 Remember to stay in character throughout your response, reflecting the persona and goals provided to you."""
 
 
+_QUESTION_PARTS = _split_template(QUESTION_INSTRUCTIONS)
+
+
+def render_question_instructions(goals: str) -> str:
+    """Render QUESTION_INSTRUCTIONS for an analyst's goals"""
+    return _render(_QUESTION_PARTS, {"goals": goals})
+
+
+@lru_cache(maxsize=64)
+def question_system_message(goals: str) -> SystemMessage:
+    """Return the question SystemMessage for an analyst's goals
+
+    Cached because the same analyst persona is used on every interview turn.
+    """
+    return SystemMessage(content=render_question_instructions(goals))
+
+
+FIRST_QUESTION = """Hello, my name is {name}, {role} at {affiliation}.
+
+I am writing about {topic}, focusing on: {description}
+
+To start, what are the most interesting and non-obvious insights in this area? Please include specific examples."""
+
+_FIRST_QUESTION_PARTS = _split_template(FIRST_QUESTION)
+
+
+def render_first_question(
+    topic: str, name: str, role: str, affiliation: str, description: str
+) -> str:
+    """Render FIRST_QUESTION, the analyst's opening question of an interview"""
+    return _render(
+        _FIRST_QUESTION_PARTS,
+        {
+            "topic": topic,
+            "name": name,
+            "role": role,
+            "affiliation": affiliation,
+            "description": description,
+        },
+    )
+
+
 ANSWER_INSTRUCTIONS = """You are an expert being interviewed by an analyst.
 
 Here is analyst area of focus: {goals}. 
@@ -72,6 +155,13 @@ When answering questions, follow these guidelines:
         
 And skip the addition of the brackets as well as the Document source preamble in your citation"""
 
+_ANSWER_PARTS = _split_template(ANSWER_INSTRUCTIONS)
+
+
+def render_answer_instructions(goals: str, context: object) -> str:
+    """Render ANSWER_INSTRUCTIONS"""
+    return _render(_ANSWER_PARTS, {"goals": goals, "context": context})
+
 
 SEARCH_INSTRUCTIONS = """You will be given a conversation between an analyst and an expert. 
 
@@ -83,6 +173,9 @@ Pay particular attention to the final question posed by the analyst.
 
 Convert this final question into a well-structured web search query"""
 
+# SEARCH_INSTRUCTIONS has no template slots, so its message is built once
+SEARCH_SYSTEM_MESSAGE = SystemMessage(content=SEARCH_INSTRUCTIONS)
+
 
 # ====================== Report Writing Prompts ======================
 
@@ -189,8 +282,15 @@ Your task is to create a comprehensive, academically rigorous section of a resea
 - Ensure accessibility to educated non-specialists while maintaining analytical depth
 - Provide actionable conclusions and recommendations where appropriate"""
 
+_SECTION_WRITER_PARTS = _split_template(SECTION_WRITER_INSTRUCTIONS)
 
-REPORT_WRITER_INSTRUCTIONS = """You are a senior research director and technical writer with expertise in synthesizing complex research findings into comprehensive, academically rigorous reports. Your task is to create a publication-quality research report that demonstrates the depth and analytical sophistication expected in top-tier academic and industry publications.
+
+def render_section_writer_instructions(focus: str) -> str:
+    """Render SECTION_WRITER_INSTRUCTIONS"""
+    return _render(_SECTION_WRITER_PARTS, {"focus": focus})
+
+
+_REPORT_WRITER_BODY = """You are a senior research director and technical writer with expertise in synthesizing complex research findings into comprehensive, academically rigorous reports. Your task is to create a publication-quality research report that demonstrates the depth and analytical sophistication expected in top-tier academic and industry publications.
 
 **Research Topic**: {topic}
 
@@ -327,36 +427,42 @@ Create a comprehensive report with the following enhanced sections:
 {context}
 
 **Note**: Your report should demonstrate the analytical sophistication and insight depth expected in leading academic journals and high-impact industry publications. Focus on generating novel understanding rather than simply aggregating information.
+"""
 
+REPORT_WRITER_INSTRUCTIONS = (
+    _REPORT_WRITER_BODY
+    + """
 [Note]
 - Write your response in same language as the topic(including the title and section headers).
 - Write your answer in professional, academic tone.
 """
+)
 
 
-INTRO_CONCLUSION_INSTRUCTIONS = """You are a technical writer finishing a report on {topic}
-
-You will be given all of the sections of the report.
+# The language note comes last so it covers the introduction and conclusion too
+REPORT_PARTS_INSTRUCTIONS = (
+    _REPORT_WRITER_BODY
+    + """
+**Introduction and Conclusion**:
+In addition to the report body, write a crisp and compelling introduction and conclusion for the report on {topic}.
 
-You job is to write a crisp and compelling introduction or conclusion section.
+- Include no pre-amble for either section.
+- Target around 200 words each, crisply previewing (for introduction) or recapping (for conclusion) all of the sections of the report.
+- Use markdown formatting.
+- For the introduction, create a compelling title and use the # header for the title, then use ## Introduction as the section header.
+- For the conclusion, use ## Conclusion as the section header.
 
-The user will instruct you whether to write the introduction or conclusion.
-
-Include no pre-amble for either section.
-
-Target around 200 words, crisply previewing (for introduction),  or recapping (for conclusion) all of the sections of the report.
-
-Use markdown formatting.
-
-For your introduction, create a compelling title and use the # header for the title.
-
-For your introduction, use ## Introduction as the section header.
-
-For your conclusion, use ## Conclusion as the section header.
-
-Here are the sections to reflect on for writing: {formatted_str_sections}
+Return the introduction, the report body, and the conclusion as separate fields.
 
 [Note]
-- Write your response in same language as the topic(including the title and section headers).
+- Write all three fields in same language as the topic(including the # title and all section headers, such as Introduction and Conclusion).
 - Write your answer in professional, academic tone.
 """
+)
+
+_REPORT_PARTS_PARTS = _split_template(REPORT_PARTS_INSTRUCTIONS)
+
+
+def render_report_parts_instructions(topic: str, context: str) -> str:
+    """Render REPORT_PARTS_INSTRUCTIONS"""
+    return _render(_REPORT_PARTS_PARTS, {"topic": topic, "context": context})
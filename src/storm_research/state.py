@@ -4,10 +4,10 @@ This module defines the states used at each stage of the research process.
 """
 
 import operator
-from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Annotated, Optional
 from typing_extensions import TypedDict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langgraph.graph import MessagesState
 from langchain_core.messages import AnyMessage
 from langgraph.graph import add_messages
@@ -23,6 +23,10 @@ class Analyst(BaseModel):
     Each analyst has unique perspectives and expertise.
     """
 
+    # Immutable and hashable, so analysts can key caches; persona is
+    # computed once per analyst rather than on every access
+    model_config = ConfigDict(frozen=True, ignored_types=(cached_property,))
+
     # Primary affiliation information
     affiliation: str = Field(description="Analyst's primary organization")
     # Name
@@ -32,10 +36,18 @@ class Analyst(BaseModel):
     # Description of focus, concerns, and motivations
     description: str = Field(description="Description of analyst's interests, concerns, and motivations")
 
-    @property
+    @cached_property
     def persona(self) -> str:
         """Return analyst's persona as string"""
-        return f"Name: {self.name}\nRole: {self.role}\nAffiliation: {self.affiliation}\nDescription: {self.description}\n"
+        return "\n".join(
+            (
+                "Name: " + self.name,
+                "Role: " + self.role,
+                "Affiliation: " + self.affiliation,
+                "Description: " + self.description,
+                "",
+            )
+        )
 
 
 class Perspectives(BaseModel):
@@ -52,21 +64,41 @@ class SearchQuery(BaseModel):
     search_query: str = Field(None, description="Search query for information retrieval")
 
 
+class ReportParts(BaseModel):
+    """Data class for the parts of the final report"""
+
+    introduction: str = Field(description="Report introduction starting with a # title")
+    body: str = Field(description="Report body starting with ## Insights")
+    conclusion: str = Field(description="Report conclusion")
+
+
 # ====================== State Definitions ======================
 
 
-@dataclass
-class InputState:
+def append_buffer(left: str, right: str) -> str:
+    """Append new transcript lines to an interview buffer"""
+    if not left:
+        return right
+    if not right:
+        return left
+    return left + "\n" + right
+
+
+def merge_sections(left: dict, right: Optional[dict]) -> dict:
+    """Merge written sections keyed by analyst index, or clear on None"""
+    if right is None:
+        return {}
+    return {**left, **right}
+
+
+class InputState(TypedDict):
     """Schema for graph input"""
 
     # Research topic
-    messages: Annotated[Sequence[AnyMessage], add_messages] = field(
-        default_factory=list
-    )
+    messages: Annotated[Sequence[AnyMessage], add_messages]
 
 
-@dataclass
-class OutputState:
+class OutputState(TypedDict):
     """Schema for graph output"""
 
     # Completed final report
@@ -94,14 +126,22 @@ class InterviewState(MessagesState):
 
     # Conversation turns
     max_num_turns: int
+    # Number of expert answers so far, incremented by each answer
+    num_expert_responses: Annotated[int, operator.add]
+    # Search query shared by web and ArXiv search
+    search_query: str
     # Context list containing source documents
     context: Annotated[list, operator.add]
     # Analyst currently being interviewed
     analyst: Analyst
+    # Running transcript, appended to as each message is generated
+    interview_buffer: Annotated[str, append_buffer]
     # String storing interview content
     interview: str
-    # List of written report sections
-    sections: list
+    # Position of the analyst in the generated analyst list
+    analyst_index: int
+    # Written section handed to the main graph, keyed by analyst index
+    sections: dict
 
 
 class ResearchGraphState(TypedDict):
@@ -115,8 +155,9 @@ class ResearchGraphState(TypedDict):
     human_analyst_feedback: Optional[str]
     # Generated analyst list
     analysts: List[Analyst]
-    # Sections written by each analyst
-    sections: Annotated[list, operator.add]
+    # Sections written by each analyst, keyed by analyst index so the
+    # report follows analyst order; cleared at the start of each run
+    sections: Annotated[dict, merge_sections]
     # Introduction of final report
     introduction: str
     # Body content of final report
@@ -127,6 +168,4 @@ class ResearchGraphState(TypedDict):
     final_report: str
 
     # Research topic
-    messages: Annotated[Sequence[AnyMessage], add_messages] = field(
-        default_factory=list
-    )
+    messages: Annotated[Sequence[AnyMessage], add_messages]
@@ -3,11 +3,116 @@
 This module defines various tools used in the research process.
 """
 
-from typing import Optional
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Optional
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_community.retrievers import ArxivRetriever
 from langchain_core.runnables import RunnableConfig
 from storm_research.configuration import Configuration
+from storm_research.utils import loop_semaphore
+
+# Separator placed between formatted documents in joined search results
+_DOCUMENT_SEPARATOR = "\n\n---\n\n"
+
+# Web results go stale, so cached ones expire after an hour
+_WEB_CACHE_TTL = 3600
+
+# ArXiv results carry full paper text, so their cache is also bounded by
+# total characters and expires after a day
+_ARXIV_CACHE_TTL = 24 * 3600
+_ARXIV_CACHE_MAX_CHARS = 1_000_000
+
+# Optional persistent ArXiv result cache, set by install_arxiv_cache
+_ARXIV_DISK_CACHE = None
+_ARXIV_CACHE_EXPIRE = 7 * 24 * 3600
+
+
+def install_arxiv_cache(
+    directory: str = ".storm_arxiv_cache", expire: int = _ARXIV_CACHE_EXPIRE
+) -> bool:
+    """Persist formatted ArXiv results on disk across runs
+
+    Paper metadata and abstracts rarely change, so repeated queries are
+    answered from disk instead of calling ArXiv again.
+
+    Args:
+        directory: Directory holding the diskcache database
+        expire: Seconds before a cached result expires
+
+    Returns:
+        True if the cache was installed, False if diskcache is not available
+    """
+    global _ARXIV_DISK_CACHE, _ARXIV_CACHE_EXPIRE
+
+    try:
+        from diskcache import Cache
+    except ImportError:
+        # diskcache is an optional dependency
+        return False
+
+    _ARXIV_DISK_CACHE = Cache(directory)
+    _ARXIV_CACHE_EXPIRE = expire
+    return True
+
+
+def _query_key(query: str) -> str:
+    """Normalize a search query into a cache key
+
+    Only case and runs of whitespace are ignored; word order and symbols
+    are kept, so different questions never share a cache entry.
+    """
+    return " ".join(query.casefold().split())
+
+
+class _SearchCache:
+    """Bounded FIFO cache of formatted search results keyed by normalized query"""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        max_chars: Optional[int] = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_chars = max_chars
+        self._results: OrderedDict = OrderedDict()
+        self._chars = 0
+
+    def get(self, query: str) -> Optional[str]:
+        entry = self._results.get(_query_key(query))
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._pop(_query_key(query))
+            return None
+        return result
+
+    def put(self, query: str, result: str) -> None:
+        if self.max_size <= 0:
+            return
+        if self.max_chars is not None and len(result) > self.max_chars:
+            return
+        key = _query_key(query)
+        self._pop(key)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._results[key] = (expires_at, result)
+        self._chars += len(result)
+        while len(self._results) > self.max_size or (
+            self.max_chars is not None and self._chars > self.max_chars
+        ):
+            _, (_, evicted) = self._results.popitem(last=False)
+            self._chars -= len(evicted)
+
+    def _pop(self, key: str) -> None:
+        entry = self._results.pop(key, None)
+        if entry is not None:
+            self._chars -= len(entry[1])
 
 
 class SearchTools:
@@ -32,6 +137,45 @@ class SearchTools:
             load_all_available_meta=True,
             get_full_documents=True,
         )
+
+        # Bounds in-flight search API calls, one semaphore per event loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # Formatted results of successful searches, per source
+        self._web_cache = _SearchCache(
+            self.configuration.search_cache_size, ttl=_WEB_CACHE_TTL
+        )
+        self._arxiv_cache = _SearchCache(
+            self.configuration.search_cache_size,
+            ttl=_ARXIV_CACHE_TTL,
+            max_chars=_ARXIV_CACHE_MAX_CHARS,
+        )
+
+    def _search_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent search API calls"""
+        return loop_semaphore(
+            self._semaphores, self.configuration.max_search_concurrency
+        )
+    
+    async def stream_web(self, query: str) -> AsyncIterator[str]:
+        """Yield formatted web search documents one at a time
+        
+        Args:
+            query: Search query
+            
+        Yields:
+            Formatted search result documents
+        """
+        # Search the web using Tavily API
+        async with self._search_semaphore():
+            search_results = await self.tavily_search.ainvoke(query)
+        
+        # Format results as documents
+        for doc in search_results:
+            yield (
+                '<Document href="' + doc["url"] + '"/>\n'
+                + doc["content"] + "\n</Document>"
+            )
     
     async def search_web(self, query: str) -> str:
         """Search for information on the web
@@ -42,24 +186,46 @@ class SearchTools:
         Returns:
             Formatted search results
         """
+        cached = self._web_cache.get(query)
+        if cached is not None:
+            return cached
+
         try:
-            # Search the web using Tavily API
-            search_results = await self.tavily_search.ainvoke(query)
-            
-            # Format results as documents
-            formatted_results = []
-            for doc in search_results:
-                formatted_doc = (
-                    f'<Document href="{doc["url"]}"/>\n'
-                    f'{doc["content"]}\n'
-                    f'</Document>'
-                )
-                formatted_results.append(formatted_doc)
-            
-            return "\n\n---\n\n".join(formatted_results)
-            
+            result = _DOCUMENT_SEPARATOR.join(
+                [doc async for doc in self.stream_web(query)]
+            )
         except Exception as e:
             return f"<Error>Error occurred during web search: {str(e)}</Error>"
+
+        self._web_cache.put(query, result)
+        return result
+    
+    async def stream_arxiv(self, query: str) -> AsyncIterator[str]:
+        """Yield formatted ArXiv paper documents one at a time
+        
+        Args:
+            query: Search query
+            
+        Yields:
+            Formatted search result documents
+        """
+        # Search papers on ArXiv
+        async with self._search_semaphore():
+            arxiv_results = await self.arxiv_retriever.ainvoke(query)
+        
+        # Format results as documents
+        for doc in arxiv_results:
+            metadata = doc.metadata
+            get = metadata.get
+            yield (
+                '<Document source="' + metadata["entry_id"] + '" '
+                'date="' + str(get("Published", "")) + '" '
+                'authors="' + str(get("Authors", "")) + '"/>\n'
+                "<Title>\n" + metadata["Title"] + "\n</Title>\n\n"
+                "<Summary>\n" + metadata["Summary"] + "\n</Summary>\n\n"
+                "<Content>\n" + doc.page_content + "\n</Content>\n"
+                "</Document>"
+            )
     
     async def search_arxiv(self, query: str) -> str:
         """Search for academic papers on ArXiv
@@ -70,30 +236,60 @@ class SearchTools:
         Returns:
             Formatted search results
         """
+        cached = self._arxiv_cache.get(query)
+        if cached is not None:
+            return cached
+
+        # The result depends on the document limit as well as the query;
+        # diskcache does blocking SQLite I/O, so it runs in a worker thread
+        disk_key = f"arxiv:{self.configuration.arxiv_max_docs}:{query}"
+        if _ARXIV_DISK_CACHE is not None:
+            cached = await asyncio.to_thread(_ARXIV_DISK_CACHE.get, disk_key)
+            if cached is not None:
+                self._arxiv_cache.put(query, cached)
+                return cached
+
         try:
-            # Search papers on ArXiv
-            arxiv_results = await self.arxiv_retriever.ainvoke(query)
-            
-            # Format results as documents
-            formatted_results = []
-            for doc in arxiv_results:
-                metadata = doc.metadata
-                formatted_doc = (
-                    f'<Document source="{metadata["entry_id"]}" '
-                    f'date="{metadata.get("Published", "")}" '
-                    f'authors="{metadata.get("Authors", "")}"/>\n'
-                    f'<Title>\n{metadata["Title"]}\n</Title>\n\n'
-                    f'<Summary>\n{metadata["Summary"]}\n</Summary>\n\n'
-                    f'<Content>\n{doc.page_content}\n</Content>\n'
-                    f'</Document>'
-                )
-                formatted_results.append(formatted_doc)
-            
-            return "\n\n---\n\n".join(formatted_results)
-            
+            result = _DOCUMENT_SEPARATOR.join(
+                [doc async for doc in self.stream_arxiv(query)]
+            )
         except Exception as e:
             return f"<Error>Error occurred during ArXiv search: {str(e)}</Error>"
 
+        self._arxiv_cache.put(query, result)
+        if _ARXIV_DISK_CACHE is not None:
+            await asyncio.to_thread(
+                _ARXIV_DISK_CACHE.set, disk_key, result, expire=_ARXIV_CACHE_EXPIRE
+            )
+        return result
+
+    async def search_all(self, query: str) -> dict:
+        """Search the web and ArXiv concurrently
+
+        Args:
+            query: Search query
+
+        Returns:
+            Dictionary with formatted "web" and "arxiv" search results
+        """
+        web_results, arxiv_results = await asyncio.gather(
+            self.search_web(query), self.search_arxiv(query), return_exceptions=True
+        )
+
+        return {
+            "web": _error_result(web_results, "web search"),
+            "arxiv": _error_result(arxiv_results, "ArXiv search"),
+        }
+
+
+def _error_result(result: object, source: str) -> str:
+    """Format an exception returned by asyncio.gather as an error result"""
+    if isinstance(result, Exception):
+        return f"<Error>Error occurred during {source}: {str(result)}</Error>"
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
 
 # Tool instance creation function
 def get_search_tools(config: Optional[RunnableConfig] = None) -> SearchTools:
@@ -105,4 +301,43 @@ def get_search_tools(config: Optional[RunnableConfig] = None) -> SearchTools:
     Returns:
         SearchTools instance
     """
-    return SearchTools(config)
\ No newline at end of file
+    configuration = Configuration.from_runnable_config(config)
+    return _cached_search_tools(
+        configuration.tavily_max_results,
+        configuration.arxiv_max_docs,
+        configuration.max_search_concurrency,
+        configuration.search_cache_size,
+    )
+
+
+@lru_cache(maxsize=16)
+def _cached_search_tools(
+    tavily_max_results: int,
+    arxiv_max_docs: int,
+    max_search_concurrency: int,
+    search_cache_size: int,
+) -> SearchTools:
+    """Create and cache a SearchTools instance per search setting combination"""
+    return SearchTools(
+        {
+            "configurable": {
+                "tavily_max_results": tavily_max_results,
+                "arxiv_max_docs": arxiv_max_docs,
+                "max_search_concurrency": max_search_concurrency,
+                "search_cache_size": search_cache_size,
+            }
+        }
+    )
+
+
+def preload_default_tools() -> SearchTools:
+    """Build the default SearchTools ahead of the first request
+
+    Long-running services can call this at startup so the first research
+    run does not pay for initializing the search clients. The instance is
+    the one get_search_tools returns for the default configuration.
+
+    Returns:
+        SearchTools instance for the default configuration
+    """
+    return get_search_tools()
@@ -3,8 +3,14 @@
 This module provides common utility functions used throughout the project.
 """
 
+import asyncio
 import os
-from typing import Union, Optional
+import re
+import uuid
+import weakref
+from functools import lru_cache
+from typing import Iterable, Union, Optional
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from langchain_openai.chat_models import AzureChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -12,8 +18,26 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 
+def _azure_credentials(model_string: str) -> tuple:
+    """Return the Azure endpoint and API key used by a model string
+
+    Non-Azure model strings return (None, None) so their cache keys do not
+    depend on Azure environment variables.
+    """
+    if not model_string.startswith("azure/"):
+        return None, None
+    return (
+        os.environ.get("AZURE_OPENAI_ENDPOINT"),
+        os.environ.get("AZURE_OPENAI_API_KEY"),
+    )
+
+
 def load_chat_model(model_string: str) -> BaseChatModel:
     """Parse model string and load appropriate Chat model
+
+    Models are cached per model string (and Azure credentials) so every node
+    reuses the same client and its connection pool. LangChain chat models are
+    safe to share across concurrent calls.
     
     Args:
         model_string: String in "provider/model-name" format
@@ -24,6 +48,14 @@ def load_chat_model(model_string: str) -> BaseChatModel:
     Raises:
         ValueError: If provider is not supported
     """
+    return _build_chat_model(model_string, *_azure_credentials(model_string))
+
+
+@lru_cache(maxsize=32)
+def _build_chat_model(
+    model_string: str, azure_endpoint: Optional[str], azure_api_key: Optional[str]
+) -> BaseChatModel:
+    """Create the Chat model for a model string and Azure credentials"""
     # Separate provider and model name
     try:
         provider, model_name = model_string.split("/", 1)
@@ -39,9 +71,6 @@ def load_chat_model(model_string: str) -> BaseChatModel:
         return ChatAnthropic(model=model_name)
     elif provider == "azure":
         # Azure OpenAI configuration
-        azure_endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
-        azure_api_key = os.environ.get("AZURE_OPENAI_API_KEY")
-        
         if not azure_endpoint or not azure_api_key:
             raise ValueError(
                 "To use Azure OpenAI, AZURE_OPENAI_ENDPOINT and "
@@ -59,6 +88,81 @@ def load_chat_model(model_string: str) -> BaseChatModel:
         raise ValueError(f"Unsupported provider: {provider}")
 
 
+def load_structured_model(model_string: str, schema: type) -> Runnable:
+    """Load a Chat model bound to a structured output schema
+
+    The bound model is cached per (model string, schema) pair so the
+    output schema is converted only once.
+
+    Args:
+        model_string: String in "provider/model-name" format
+        schema: Pydantic model class describing the output
+
+    Returns:
+        Runnable returning instances of the schema
+    """
+    return _build_structured_model(
+        model_string, schema, *_azure_credentials(model_string)
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_structured_model(
+    model_string: str,
+    schema: type,
+    azure_endpoint: Optional[str],
+    azure_api_key: Optional[str],
+) -> Runnable:
+    """Bind the cached Chat model for a model string to an output schema"""
+    return _build_chat_model(
+        model_string, azure_endpoint, azure_api_key
+    ).with_structured_output(schema)
+
+
+# One semaphore per event loop; a semaphore cannot be shared across loops
+_LLM_SEMAPHORES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_llm_concurrency() -> int:
+    """Return the maximum number of concurrent LLM calls
+
+    Read from the STORM_LLM_CONCURRENCY environment variable (default 8).
+    """
+    return max(1, int(os.environ.get("STORM_LLM_CONCURRENCY", "8")))
+
+
+def loop_semaphore(
+    semaphores: weakref.WeakKeyDictionary, limit: int
+) -> asyncio.Semaphore:
+    """Return the semaphore for the running event loop from a registry
+
+    A semaphore cannot be shared across event loops, so the registry keeps
+    one per loop and creates it on first use.
+
+    Args:
+        semaphores: Registry mapping event loops to semaphores
+        limit: Semaphore value used when creating a new semaphore
+
+    Returns:
+        Semaphore bound to the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        semaphores[loop] = semaphore
+    return semaphore
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent LLM calls on the running loop
+
+    Wrap model calls in ``async with llm_semaphore():`` so parallel interviews
+    do not exceed the provider's rate limits all at once.
+    """
+    return loop_semaphore(_LLM_SEMAPHORES, get_llm_concurrency())
+
+
 def extract_text_from_message(
     message: Union[AIMessage, HumanMessage, SystemMessage, str]
 ) -> str:
@@ -95,6 +199,22 @@ def format_analyst_description(analyst) -> str:
     )
 
 
+def format_analyst_descriptions(analysts: Iterable) -> str:
+    """Format a list of analysts for display in one string
+    
+    Args:
+        analysts: Analyst objects
+        
+    Returns:
+        Formatted analyst descriptions, one per line block
+    """
+    return "\n".join(map(format_analyst_description, analysts))
+
+
+_SECTION_HEADER_PREFIX = "\n\n## "
+_SECTION_HEADER_SUFFIX = "\n\n"
+
+
 def format_section_header(section_name: str) -> str:
     """Format section header in consistent style
     
@@ -104,7 +224,7 @@ def format_section_header(section_name: str) -> str:
     Returns:
         Formatted header
     """
-    return f"\n\n## {section_name}\n\n"
+    return _SECTION_HEADER_PREFIX + section_name + _SECTION_HEADER_SUFFIX
 
 
 def truncate_text(text: str, max_length: int = 1000) -> str:
@@ -122,6 +242,10 @@ def truncate_text(text: str, max_length: int = 1000) -> str:
     return text[:max_length-3] + "..."
 
 
+_DOCUMENT_TAG_RE = re.compile(r'<Document source="|"/>|</Document>')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def clean_source_citation(source: str) -> str:
     """Clean up source citations
     
@@ -131,15 +255,8 @@ def clean_source_citation(source: str) -> str:
     Returns:
         Cleaned source string
     """
-    # Remove Document tags
-    source = source.replace('<Document source="', '')
-    source = source.replace('"/>', '')
-    source = source.replace('</Document>', '')
-    
-    # Remove duplicate spaces
-    source = ' '.join(source.split())
-    
-    return source.strip()
+    # Remove Document tags, then collapse duplicate spaces
+    return _WHITESPACE_RE.sub(" ", _DOCUMENT_TAG_RE.sub("", source)).strip()
 
 
 def generate_thread_id() -> str:
@@ -148,5 +265,61 @@ def generate_thread_id() -> str:
     Returns:
         UUID-based thread ID
     """
-    import uuid
-    return str(uuid.uuid4())
\ No newline at end of file
+    return str(uuid.uuid4())
+
+
+def install_llm_cache(database_path: str = ".storm_llm_cache.db") -> None:
+    """Cache LLM responses in a local SQLite database
+
+    Identical prompts to the same model are answered from the cache,
+    which avoids repeated calls when the same topic is run again.
+
+    Args:
+        database_path: Path of the SQLite cache database
+    """
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(SQLiteCache(database_path=database_path))
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy if it is available
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and not available on Windows
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def install_eager_task_factory() -> bool:
+    """Use asyncio's eager task factory for newly created event loops
+
+    Eager tasks start running immediately and skip an event loop round-trip
+    when the coroutine finishes without suspending. Must be called after
+    any event loop policy (such as uvloop) is installed.
+
+    Returns:
+        True if installed, False if the Python version lacks eager tasks (< 3.12)
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+
+    policy = asyncio.get_event_loop_policy()
+    new_event_loop = policy.new_event_loop
+
+    def new_eager_event_loop() -> asyncio.AbstractEventLoop:
+        loop = new_event_loop()
+        loop.set_task_factory(eager_task_factory)
+        return loop
+
+    policy.new_event_loop = new_eager_event_loop  # type: ignore[method-assign]
+    return True
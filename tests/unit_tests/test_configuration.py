@@ -0,0 +1,53 @@
+"""Configuration tests"""
+
+import dataclasses
+
+import pytest
+from storm_research.configuration import Configuration
+
+
+class TestFromRunnableConfig:
+    """Tests for Configuration.from_runnable_config"""
+
+    def test_defaults_without_config(self):
+        """Test default values are used when no config is given"""
+        configuration = Configuration.from_runnable_config(None)
+        assert configuration == Configuration()
+
+    def test_empty_configurable_reuses_defaults(self):
+        """Test empty configurable returns the shared default instance"""
+        assert Configuration.from_runnable_config(
+            {}
+        ) is Configuration.from_runnable_config({"configurable": {}})
+
+    def test_overrides_applied(self):
+        """Test configurable values override defaults"""
+        configuration = Configuration.from_runnable_config(
+            {"configurable": {"model": "openai/gpt-4.1", "max_analysts": 5}}
+        )
+        assert configuration.model == "openai/gpt-4.1"
+        assert configuration.max_analysts == 5
+        assert configuration.max_interview_turns == Configuration().max_interview_turns
+
+    def test_unknown_keys_ignored(self):
+        """Test keys that are not configuration fields are ignored"""
+        configuration = Configuration.from_runnable_config(
+            {"configurable": {"thread_id": "research-001"}}
+        )
+        assert configuration == Configuration()
+
+    def test_frozen(self):
+        """Test Configuration instances are immutable"""
+        configuration = Configuration()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            configuration.model = "openai/gpt-4.1"
+
+    def test_same_configurable_is_cached(self):
+        """Test identical configurables resolve to the same instance"""
+        first = Configuration.from_runnable_config(
+            {"configurable": {"thread_id": "a", "max_analysts": 4}}
+        )
+        second = Configuration.from_runnable_config(
+            {"configurable": {"thread_id": "b", "max_analysts": 4}}
+        )
+        assert first is second
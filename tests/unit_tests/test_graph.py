@@ -0,0 +1,125 @@
+"""Graph tests"""
+
+import asyncio
+import importlib
+
+from langchain_core.messages import AIMessage, HumanMessage, get_buffer_string
+from langgraph.graph.state import CompiledStateGraph
+
+import storm_research
+from storm_research.state import Analyst
+
+graph_module = importlib.import_module("storm_research.graph")
+
+
+class TestLazyGraph:
+    """Tests for lazy compilation of the research graph"""
+
+    def test_graph_is_compiled_on_access(self):
+        """Test accessing graph returns a compiled graph"""
+        assert isinstance(graph_module.graph, CompiledStateGraph)
+
+    def test_graph_is_cached(self):
+        """Test the compiled graph is built once and shared"""
+        assert graph_module.graph is graph_module.graph
+        assert storm_research.graph is graph_module.graph
+
+    def test_unknown_attribute(self):
+        """Test unknown module attributes still raise AttributeError"""
+        assert not hasattr(graph_module, "missing_graph")
+
+
+class TestRouteMessages:
+    """Tests for route_messages function"""
+
+    def _state(self, num_expert_responses, last_question="What else?"):
+        return {
+            "messages": [
+                HumanMessage(content=last_question),
+                AIMessage(content="Answer", name="expert"),
+            ],
+            "max_num_turns": 2,
+            "num_expert_responses": num_expert_responses,
+        }
+
+    def test_continue_interview(self):
+        """Test another question is asked below the turn limit"""
+        assert graph_module.route_messages(self._state(1)) == "ask_question"
+
+    def test_max_turns_reached(self):
+        """Test interview is saved once the turn limit is reached"""
+        assert graph_module.route_messages(self._state(2)) == "save_interview"
+
+    def test_end_signal(self):
+        """Test interview is saved when the analyst ends it"""
+        state = self._state(1, "Thank you so much for your help!")
+        assert graph_module.route_messages(state) == "save_interview"
+
+    def test_end_signal_after_long_question(self):
+        """Test the end signal is found at the end of a long message"""
+        question = "Context. " * 500 + "Thank you so much for your help!\n"
+        state = self._state(1, question)
+        assert graph_module.route_messages(state) == "save_interview"
+
+    def test_end_signal_in_content_blocks(self):
+        """Test list content, such as thinking plus text blocks, is handled"""
+        question = [
+            {"type": "thinking", "thinking": "Wrap up."},
+            {"type": "text", "text": "Thank you so much for your help!"},
+        ]
+        state = self._state(1, question)
+        assert graph_module.route_messages(state) == "save_interview"
+
+    def test_end_signal_quoted_early_is_ignored(self):
+        """Test the phrase early in a long question does not end the interview"""
+        question = "Thank you so much for your help earlier. " + "Next? " * 100
+        state = self._state(1, question)
+        assert graph_module.route_messages(state) == "ask_question"
+
+
+class TestFinalizeReport:
+    """Tests for finalize_report function"""
+
+    def _finalize(self, content):
+        state = {
+            "introduction": "# Title\n\n## Introduction\n\nIntro",
+            "content": content,
+            "conclusion": "## Conclusion\n\nDone",
+        }
+        return asyncio.run(graph_module.finalize_report(state))["final_report"]
+
+    def test_insights_title_removed(self):
+        """Test only the Insights title prefix is removed from the body"""
+        report = self._finalize("## Insights\nInsightful things")
+        assert "## Insights" not in report
+        assert "## Main Idea\n\nInsightful things\n\n---" in report
+
+    def test_sources_moved_to_end(self):
+        """Test Sources section is appended after the conclusion"""
+        report = self._finalize("## Insights\nBody\n## Sources\n[1] Source")
+        assert report.endswith("## Conclusion\n\nDone\n\n## Sources\n[1] Source")
+
+
+class TestInitiateAllInterviews:
+    """Tests for initiate_all_interviews function"""
+
+    def test_interviews_open_with_first_question(self):
+        """Test each interview starts with the analyst's templated question"""
+        analyst = Analyst(
+            affiliation="University",
+            name="Dana",
+            role="Researcher",
+            description="Model efficiency",
+        )
+        sends = graph_module.initiate_all_interviews(
+            {"topic": "Small language models", "analysts": [analyst]}
+        )
+
+        assert len(sends) == 1
+        payload = sends[0].arg
+        assert payload["analyst_index"] == 0
+        opening, first_question = payload["messages"]
+        assert "Small language models" in opening.content
+        assert "Dana" in first_question.content
+        assert "Model efficiency" in first_question.content
+        assert payload["interview_buffer"] == get_buffer_string(payload["messages"])
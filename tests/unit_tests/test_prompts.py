@@ -0,0 +1,58 @@
+"""Prompt rendering tests"""
+
+from storm_research.prompts import (
+    ANALYST_INSTRUCTIONS,
+    ANSWER_INSTRUCTIONS,
+    QUESTION_INSTRUCTIONS,
+    REPORT_PARTS_INSTRUCTIONS,
+    SECTION_WRITER_INSTRUCTIONS,
+    render_analyst_instructions,
+    render_answer_instructions,
+    render_question_instructions,
+    render_report_parts_instructions,
+    render_section_writer_instructions,
+)
+
+
+class TestRenderInstructions:
+    """Tests that precompiled renderers match str.format"""
+
+    def test_analyst_instructions(self):
+        """Test rendering analyst generation instructions"""
+        assert render_analyst_instructions(
+            topic="AI", human_analyst_feedback="", max_analysts=3
+        ) == ANALYST_INSTRUCTIONS.format(
+            topic="AI", human_analyst_feedback="", max_analysts=3
+        )
+
+    def test_question_instructions(self):
+        """Test rendering question instructions"""
+        assert render_question_instructions("Goals") == QUESTION_INSTRUCTIONS.format(
+            goals="Goals"
+        )
+
+    def test_answer_instructions(self):
+        """Test rendering answer instructions with a list context"""
+        context = ["<Document/>\nweb", "<Document/>\narxiv"]
+        assert render_answer_instructions(
+            goals="Goals", context=context
+        ) == ANSWER_INSTRUCTIONS.format(goals="Goals", context=context)
+
+    def test_section_writer_instructions(self):
+        """Test rendering section writer instructions"""
+        assert render_section_writer_instructions(
+            focus="Focus"
+        ) == SECTION_WRITER_INSTRUCTIONS.format(focus="Focus")
+
+    def test_report_parts_instructions(self):
+        """Test rendering report instructions"""
+        assert render_report_parts_instructions(
+            topic="AI", context="Sections"
+        ) == REPORT_PARTS_INSTRUCTIONS.format(topic="AI", context="Sections")
+
+    def test_report_parts_language_note_is_last(self):
+        """Test the language note follows the introduction and conclusion rules"""
+        assert REPORT_PARTS_INSTRUCTIONS.count("[Note]") == 1
+        assert REPORT_PARTS_INSTRUCTIONS.index(
+            "## Conclusion"
+        ) < REPORT_PARTS_INSTRUCTIONS.index("[Note]")
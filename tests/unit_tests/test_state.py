@@ -0,0 +1,46 @@
+"""State model and reducer tests"""
+
+import pytest
+from pydantic import ValidationError
+
+from storm_research.state import (
+    Analyst,
+    append_buffer,
+    merge_sections,
+)
+
+
+class TestReducers:
+    """Tests for custom state reducers"""
+
+    def test_append_buffer(self):
+        """Test transcript lines are joined with a newline"""
+        assert append_buffer("", "Human: hi") == "Human: hi"
+        assert append_buffer("Human: hi", "AI: hello") == "Human: hi\nAI: hello"
+
+    def test_merge_sections(self):
+        """Test sections merge by analyst index and are cleared by None"""
+        sections = merge_sections({}, {1: "## Two"})
+        sections = merge_sections(sections, {0: "## One"})
+        assert sections == {0: "## One", 1: "## Two"}
+        assert merge_sections(sections, None) == {}
+
+
+class TestAnalyst:
+    """Tests for the Analyst model"""
+
+    def test_frozen_and_hashable(self):
+        """Test analysts are immutable and usable as dict keys"""
+        analyst = Analyst(affiliation="Lab", name="Kim", role="Researcher", description="AI")
+
+        with pytest.raises(ValidationError):
+            analyst.name = "Lee"
+        assert {analyst: "section"}[analyst] == "section"
+
+    def test_persona_is_cached(self):
+        """Test persona is built once and excluded from the model data"""
+        analyst = Analyst(affiliation="Lab", name="Kim", role="Researcher", description="AI")
+
+        assert analyst.persona is analyst.persona
+        assert analyst.persona.startswith("Name: Kim\nRole: Researcher\n")
+        assert "persona" not in analyst.model_dump()
@@ -0,0 +1,193 @@
+"""Search tool tests"""
+
+import asyncio
+import sys
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import storm_research.tools as tools_module
+from storm_research.tools import (
+    SearchTools,
+    get_search_tools,
+    install_arxiv_cache,
+    preload_default_tools,
+)
+
+
+@pytest.fixture
+def search_tools(monkeypatch):
+    """SearchTools with a dummy Tavily key"""
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    return SearchTools({"configurable": {"max_search_concurrency": 1}})
+
+
+class TestSearchAll:
+    """Tests for SearchTools.search_all"""
+
+    def test_returns_both_results(self, search_tools):
+        """Test web and ArXiv results are returned by source"""
+        search_tools.search_web = AsyncMock(return_value="web")
+        search_tools.search_arxiv = AsyncMock(return_value="arxiv")
+
+        results = asyncio.run(search_tools.search_all("query"))
+
+        assert results == {"web": "web", "arxiv": "arxiv"}
+
+    def test_failed_search_becomes_error(self, search_tools):
+        """Test one failing source does not discard the other"""
+        search_tools.search_web = AsyncMock(side_effect=RuntimeError("boom"))
+        search_tools.search_arxiv = AsyncMock(return_value="arxiv")
+
+        results = asyncio.run(search_tools.search_all("query"))
+
+        assert results["web"] == "<Error>Error occurred during web search: boom</Error>"
+        assert results["arxiv"] == "arxiv"
+
+    def test_search_semaphore_limit(self, search_tools):
+        """Test the search semaphore uses max_search_concurrency"""
+
+        async def check():
+            semaphore = search_tools._search_semaphore()
+            assert semaphore is search_tools._search_semaphore()
+            async with semaphore:
+                assert semaphore.locked()
+
+        asyncio.run(check())
+
+
+class TestSearchCache:
+    """Tests for the search result cache"""
+
+    def test_case_and_spacing_hit_cache(self, search_tools):
+        """Test queries differing only in case and whitespace share results"""
+        search_tools.tavily_search = AsyncMock()
+        search_tools.tavily_search.ainvoke.return_value = [
+            {"url": "https://example.com", "content": "text"}
+        ]
+
+        first = asyncio.run(search_tools.search_web("AI impact on jobs"))
+        second = asyncio.run(search_tools.search_web("  ai  Impact on JOBS"))
+
+        assert first == second
+        search_tools.tavily_search.ainvoke.assert_awaited_once()
+
+    def test_different_questions_miss_cache(self, search_tools):
+        """Test word order and symbols are part of the cache key"""
+        search_tools.tavily_search = AsyncMock()
+        search_tools.tavily_search.ainvoke.return_value = []
+
+        for query in (
+            "C++ memory safety",
+            "C# memory safety",
+            "impact of AI on jobs",
+            "impact of jobs on AI",
+        ):
+            asyncio.run(search_tools.search_web(query))
+
+        assert search_tools.tavily_search.ainvoke.await_count == 4
+
+    def test_web_results_expire(self, search_tools, monkeypatch):
+        """Test cached web results are refetched after the TTL"""
+        search_tools.tavily_search = AsyncMock()
+        search_tools.tavily_search.ainvoke.return_value = []
+        now = [1000.0]
+        monkeypatch.setattr(tools_module.time, "monotonic", lambda: now[0])
+
+        asyncio.run(search_tools.search_web("query"))
+        now[0] += tools_module._WEB_CACHE_TTL
+        asyncio.run(search_tools.search_web("query"))
+
+        assert search_tools.tavily_search.ainvoke.await_count == 2
+
+    def test_arxiv_cache_bounded_by_characters(self, search_tools, monkeypatch):
+        """Test old ArXiv results are evicted once the character budget is used"""
+        monkeypatch.setattr(search_tools._arxiv_cache, "max_chars", 10)
+        cache = search_tools._arxiv_cache
+
+        cache.put("first", "x" * 6)
+        cache.put("second", "y" * 6)
+        cache.put("too large", "z" * 11)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "y" * 6
+        assert cache.get("too large") is None
+
+    def test_errors_are_not_cached(self, search_tools):
+        """Test failed searches are retried"""
+        search_tools.tavily_search = AsyncMock()
+        search_tools.tavily_search.ainvoke.side_effect = RuntimeError("x")
+
+        asyncio.run(search_tools.search_web("query"))
+        asyncio.run(search_tools.search_web("query"))
+
+        assert search_tools.tavily_search.ainvoke.await_count == 2
+
+
+class TestStreamWeb:
+    """Tests for SearchTools.stream_web"""
+
+    def test_yields_each_document(self, search_tools):
+        """Test documents are yielded one by one and joined by search_web"""
+        search_tools.tavily_search = AsyncMock()
+        search_tools.tavily_search.ainvoke.return_value = [
+            {"url": "https://a.com", "content": "A"},
+            {"url": "https://b.com", "content": "B"},
+        ]
+
+        async def collect():
+            return [doc async for doc in search_tools.stream_web("query")]
+
+        docs = asyncio.run(collect())
+
+        assert docs == [
+            '<Document href="https://a.com"/>\nA\n</Document>',
+            '<Document href="https://b.com"/>\nB\n</Document>',
+        ]
+        assert asyncio.run(search_tools.search_web("other")) == "\n\n---\n\n".join(docs)
+
+
+class TestPreloadDefaultTools:
+    """Tests for preload_default_tools"""
+
+    def test_returns_default_instance(self, monkeypatch):
+        """Test the preloaded tools are reused by get_search_tools"""
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+
+        assert preload_default_tools() is get_search_tools()
+
+
+class TestArxivDiskCache:
+    """Tests for the optional ArXiv disk cache"""
+
+    def test_fallback_without_diskcache(self, monkeypatch):
+        """Test install_arxiv_cache reports False when diskcache is missing"""
+        monkeypatch.setitem(sys.modules, "diskcache", None)
+
+        assert install_arxiv_cache() is False
+
+    def test_disk_cache_hit_skips_arxiv(self, search_tools, monkeypatch):
+        """Test a result stored on disk is returned without searching"""
+        disk_cache = MagicMock()
+        disk_cache.get.return_value = "cached papers"
+        monkeypatch.setattr(tools_module, "_ARXIV_DISK_CACHE", disk_cache)
+        search_tools.arxiv_retriever = AsyncMock()
+
+        assert asyncio.run(search_tools.search_arxiv("query")) == "cached papers"
+        disk_cache.get.assert_called_once_with("arxiv:3:query")
+        search_tools.arxiv_retriever.ainvoke.assert_not_awaited()
+
+    def test_disk_key_includes_max_docs(self, monkeypatch):
+        """Test results are stored per ArXiv document limit"""
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+        disk_cache = MagicMock()
+        disk_cache.get.return_value = None
+        monkeypatch.setattr(tools_module, "_ARXIV_DISK_CACHE", disk_cache)
+        search_tools = SearchTools({"configurable": {"arxiv_max_docs": 5}})
+        search_tools.arxiv_retriever = AsyncMock()
+        search_tools.arxiv_retriever.ainvoke.return_value = []
+
+        asyncio.run(search_tools.search_arxiv("query"))
+
+        disk_cache.get.assert_called_once_with("arxiv:5:query")
+        assert disk_cache.set.call_args.args[0] == "arxiv:5:query"
@@ -1,8 +1,25 @@
 """Utility function tests"""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
-from storm_research.utils import load_chat_model
+from storm_research.utils import (
+    _build_chat_model,
+    _build_structured_model,
+    clean_source_citation,
+    extract_text_from_message,
+    format_analyst_description,
+    format_analyst_descriptions,
+    install_eager_task_factory,
+    install_llm_cache,
+    install_uvloop,
+    llm_semaphore,
+    load_chat_model,
+    load_structured_model,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from storm_research.state import Analyst, SearchQuery
 from langchain_openai import ChatOpenAI
 from langchain_openai.chat_models import AzureChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -11,6 +28,15 @@ from langchain_anthropic import ChatAnthropic
 class TestLoadChatModel:
     """Tests for load_chat_model function"""
 
+    @pytest.fixture(autouse=True)
+    def clear_model_cache(self):
+        """Clear cached models so each test builds its own"""
+        _build_chat_model.cache_clear()
+        _build_structured_model.cache_clear()
+        yield
+        _build_chat_model.cache_clear()
+        _build_structured_model.cache_clear()
+
     @patch.dict("os.environ", {"OPENAI_API_KEY": "test-api-key"})
     def test_load_openai_model(self):
         """Test loading OpenAI model"""
@@ -61,3 +87,141 @@ class TestLoadChatModel:
             load_chat_model("unsupported/model")
 
         assert "Unsupported provider: unsupported" in str(exc_info.value)
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-api-key"})
+    def test_model_is_cached(self):
+        """Test the same model string returns the cached model"""
+        assert load_chat_model("openai/gpt-4.1") is load_chat_model("openai/gpt-4.1")
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-api-key"})
+    def test_structured_model_is_cached(self):
+        """Test the same model and schema return the cached structured model"""
+        structured_model = load_structured_model("openai/gpt-4.1", SearchQuery)
+        assert structured_model is load_structured_model("openai/gpt-4.1", SearchQuery)
+
+    def test_azure_model_cache_follows_credentials(self):
+        """Test changed Azure credentials build a new model"""
+        env = {
+            "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+            "AZURE_OPENAI_API_KEY": "first-key",
+        }
+        with patch.dict("os.environ", env):
+            first = load_chat_model("azure/gpt-4.1")
+            assert first is load_chat_model("azure/gpt-4.1")
+        with patch.dict("os.environ", {**env, "AZURE_OPENAI_API_KEY": "second-key"}):
+            assert load_chat_model("azure/gpt-4.1") is not first
+
+
+class TestInstallUvloop:
+    """Tests for install_uvloop function"""
+
+    def test_fallback_without_uvloop(self):
+        """Test default event loop is kept when uvloop is unavailable"""
+        with patch.dict("sys.modules", {"uvloop": None}):
+            with patch("asyncio.set_event_loop_policy") as set_policy:
+                assert install_uvloop() is False
+
+        set_policy.assert_not_called()
+
+
+class TestInstallEagerTaskFactory:
+    """Tests for install_eager_task_factory function"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_policy(self):
+        """Use a fresh event loop policy for each test"""
+        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+        yield
+        asyncio.set_event_loop_policy(None)
+
+    def test_new_loops_use_eager_factory(self):
+        """Test event loops created after install use the eager task factory"""
+        factory = MagicMock()
+        with patch.object(asyncio, "eager_task_factory", factory, create=True):
+            assert install_eager_task_factory() is True
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.get_task_factory() is factory
+        finally:
+            loop.close()
+
+    def test_unsupported_python(self):
+        """Test nothing is installed when eager tasks are unavailable"""
+        with patch.object(asyncio, "eager_task_factory", None, create=True):
+            assert install_eager_task_factory() is False
+
+
+class TestInstallLlmCache:
+    """Tests for install_llm_cache function"""
+
+    def test_sqlite_cache_installed(self, tmp_path):
+        """Test a SQLite LLM cache is set globally"""
+        from langchain_community.cache import SQLiteCache
+        from langchain_core.globals import get_llm_cache, set_llm_cache
+
+        try:
+            install_llm_cache(str(tmp_path / "cache.db"))
+            assert isinstance(get_llm_cache(), SQLiteCache)
+        finally:
+            set_llm_cache(None)
+
+
+class TestLlmSemaphore:
+    """Tests for llm_semaphore function"""
+
+    @patch.dict("os.environ", {"STORM_LLM_CONCURRENCY": "2"})
+    def test_shared_within_loop(self):
+        """Test the same semaphore is returned within one event loop"""
+
+        async def get_semaphores():
+            return llm_semaphore(), llm_semaphore()
+
+        first, second = asyncio.run(get_semaphores())
+        assert first is second
+        assert first._value == 2
+
+    def test_separate_per_loop(self):
+        """Test each event loop gets its own semaphore"""
+
+        async def get_semaphore():
+            return llm_semaphore()
+
+        assert asyncio.run(get_semaphore()) is not asyncio.run(get_semaphore())
+
+
+class TestCleanSourceCitation:
+    """Tests for clean_source_citation function"""
+
+    def test_removes_tags_and_spaces(self):
+        """Test Document tags are stripped and whitespace collapsed"""
+        source = '  <Document source="http://arxiv.org/abs/1"/>\n  Title   here </Document> '
+        assert clean_source_citation(source) == "http://arxiv.org/abs/1 Title here"
+
+
+class TestFormatAnalystDescriptions:
+    """Tests for format_analyst_descriptions function"""
+
+    def test_matches_single_formatting(self):
+        """Test batch output joins the per-analyst descriptions"""
+        analysts = [
+            Analyst(affiliation="Lab", name="Kim", role="Researcher", description="AI"),
+            Analyst(affiliation="Co", name="Lee", role="Engineer", description="ML"),
+        ]
+
+        assert format_analyst_descriptions(analysts) == "\n".join(
+            format_analyst_description(analyst) for analyst in analysts
+        )
+        assert format_analyst_descriptions([]) == ""
+
+
+class TestExtractTextFromMessage:
+    """Tests for extract_text_from_message function"""
+
+    def test_message_types(self):
+        """Test strings, messages and other objects are converted to text"""
+        assert extract_text_from_message("text") == "text"
+        assert extract_text_from_message(AIMessage(content="answer")) == "answer"
+        assert extract_text_from_message(HumanMessage(content="question")) == "question"
+        assert extract_text_from_message(SystemMessage(content="rules")) == "rules"
+        assert extract_text_from_message(42) == "42"